@@ -7,12 +7,12 @@ import logging
 import time
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, HTTPException, Response, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, HTTPException, Response, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 import httpx
 import websockets
 
-from app.core.config import settings
+from app.core.config import Settings, get_settings
 from app.schemas.api import (
     QueryRequest,
     QueryResponse,
@@ -24,7 +24,7 @@ from app.schemas.api import (
 from app.services.db import db_service
 from app.services.agent import agent_service
 from app.services.chaos_state import get_chaos_state, set_chaos_state
-from app.utils.json_tools import normalize_dashboard_spec, replace_query_placeholders
+from app.utils.json_tools import dumps, normalize_dashboard_spec, replace_query_placeholders
 from app.utils.sql_guard import filter_safe_queries
 
 logger = logging.getLogger(__name__)
@@ -178,7 +178,7 @@ async def handle_query(request: QueryRequest) -> QueryResponse:
     user_id = request.userId or ""
     current_chaos = request.currentChaos
     if not current_chaos and user_id:
-        current_chaos = get_chaos_state(user_id)
+        current_chaos = await asyncio.to_thread(get_chaos_state, user_id)
 
     try:
         agent_result = await agent_service.process_query(
@@ -188,16 +188,19 @@ async def handle_query(request: QueryRequest) -> QueryResponse:
         logger.exception("Agent processing failed")
         raise HTTPException(status_code=502, detail="Agent processing failed") from exc
 
-    hydrated_spec, sql_queries, safe_queries = _finalize_spec(agent_result, current_chaos)
+    # DuckDB calls are blocking; keep them off the event loop.
+    hydrated_spec, sql_queries, safe_queries = await asyncio.to_thread(
+        _finalize_spec, agent_result, current_chaos
+    )
 
     intent = agent_result.get("intent", "unknown") if isinstance(agent_result, dict) else "unknown"
     assistant_message = agent_result.get("assistantMessage", "") if isinstance(agent_result, dict) else ""
     hydrated_spec = _maybe_strip_blocks(hydrated_spec, intent, sql_queries, safe_queries)
-    hydrated_spec = _hydrate_missing_time_series(hydrated_spec)
+    hydrated_spec = await asyncio.to_thread(_hydrate_missing_time_series, hydrated_spec)
     if user_id:
         chaos = hydrated_spec.get("chaos")
         if isinstance(chaos, dict):
-            set_chaos_state(user_id, chaos)
+            await asyncio.to_thread(set_chaos_state, user_id, chaos)
 
     elapsed_ms = int((time.time() - start_time) * 1000)
     return QueryResponse(
@@ -228,7 +231,7 @@ async def handle_query_stream(request: QueryRequest) -> StreamingResponse:
     user_id = request.userId or ""
     current_chaos = request.currentChaos
     if not current_chaos and user_id:
-        current_chaos = get_chaos_state(user_id)
+        current_chaos = await asyncio.to_thread(get_chaos_state, user_id)
 
     async def event_generator():
         streamed_content = False
@@ -241,16 +244,18 @@ async def handle_query_stream(request: QueryRequest) -> StreamingResponse:
 
                 if event_type == "result":
                     # Finalize the spec the same way as the non-streaming path
-                    hydrated_spec, sql_queries, safe_queries = _finalize_spec(
-                        data, current_chaos
+                    hydrated_spec, sql_queries, safe_queries = await asyncio.to_thread(
+                        _finalize_spec, data, current_chaos
                     )
                     intent = data.get("intent", "unknown") if isinstance(data, dict) else "unknown"
                     hydrated_spec = _maybe_strip_blocks(hydrated_spec, intent, sql_queries, safe_queries)
-                    hydrated_spec = _hydrate_missing_time_series(hydrated_spec)
+                    hydrated_spec = await asyncio.to_thread(
+                        _hydrate_missing_time_series, hydrated_spec
+                    )
                     if user_id:
                         chaos = hydrated_spec.get("chaos")
                         if isinstance(chaos, dict):
-                            set_chaos_state(user_id, chaos)
+                            await asyncio.to_thread(set_chaos_state, user_id, chaos)
                     elapsed_ms = int((time.time() - start_time) * 1000)
                     final = {
                         "dashboardSpec": DashboardSpec.model_validate(hydrated_spec).model_dump(),
@@ -268,18 +273,18 @@ async def handle_query_stream(request: QueryRequest) -> StreamingResponse:
                         chunk_size = 80
                         for i in range(0, len(assistant_msg), chunk_size):
                             chunk = assistant_msg[i : i + chunk_size]
-                            yield f"event: content\ndata: {json.dumps({'delta': chunk}, default=str)}\n\n"
+                            yield f"event: content\ndata: {dumps({'delta': chunk}, default=str)}\n\n"
                         streamed_content = True
-                    yield f"event: result\ndata: {json.dumps(final, default=str)}\n\n"
+                    yield f"event: result\ndata: {dumps(final, default=str)}\n\n"
                 elif event_type == "content":
                     streamed_content = True
-                    yield f"event: content\ndata: {json.dumps(data, default=str)}\n\n"
+                    yield f"event: content\ndata: {dumps(data, default=str)}\n\n"
                 else:
-                    yield f"event: {event_type}\ndata: {json.dumps(data, default=str)}\n\n"
+                    yield f"event: {event_type}\ndata: {dumps(data, default=str)}\n\n"
 
         except Exception as exc:
             logger.exception("SSE stream failed")
-            yield f"event: error\ndata: {json.dumps({'detail': str(exc)})}\n\n"
+            yield f"event: error\ndata: {dumps({'detail': str(exc)})}\n\n"
 
         yield "event: done\ndata: {}\n\n"
 
@@ -309,20 +314,23 @@ def set_chaos(request: ChaosPreferenceRequest) -> ChaosPreferenceResponse:
 # ── Voice (Gradium proxy) ──
 
 
-def _gradium_ws_url(kind: str) -> str:
+def _gradium_ws_url(settings: Settings, kind: str) -> str:
     region = settings.gradium_region or "eu"
     if kind == "stt":
         return f"wss://{region}.api.gradium.ai/api/speech/asr"
     return f"wss://{region}.api.gradium.ai/api/speech/tts"
 
 
-def _gradium_http_tts_url() -> str:
+def _gradium_http_tts_url(settings: Settings) -> str:
     region = settings.gradium_region or "eu"
     return f"https://{region}.api.gradium.ai/api/post/speech/tts"
 
 
 @router.websocket("/api/voice/stt")
-async def voice_stt_websocket(client_ws: WebSocket) -> None:
+async def voice_stt_websocket(
+    client_ws: WebSocket,
+    settings: Settings = Depends(get_settings),
+) -> None:
     if not settings.gradium_api_key:
         await client_ws.accept()
         await client_ws.send_text(json.dumps({"type": "error", "detail": "GRADIUM_API_KEY not configured"}))
@@ -330,7 +338,7 @@ async def voice_stt_websocket(client_ws: WebSocket) -> None:
         return
 
     await client_ws.accept()
-    gradium_url = _gradium_ws_url("stt")
+    gradium_url = _gradium_ws_url(settings, "stt")
 
     try:
         async with websockets.connect(
@@ -382,7 +390,10 @@ async def voice_stt_websocket(client_ws: WebSocket) -> None:
 
 
 @router.post("/api/voice/tts")
-async def voice_tts(request: TTSRequest) -> Response:
+async def voice_tts(
+    request: TTSRequest,
+    settings: Settings = Depends(get_settings),
+) -> Response:
     if not settings.gradium_api_key:
         raise HTTPException(status_code=500, detail="GRADIUM_API_KEY not configured")
 
@@ -398,7 +409,7 @@ async def voice_tts(request: TTSRequest) -> Response:
         "only_audio": True,
     }
     headers = {"x-api-key": settings.gradium_api_key}
-    tts_url = _gradium_http_tts_url()
+    tts_url = _gradium_http_tts_url(settings)
 
     async with httpx.AsyncClient(timeout=60) as client:
         resp = await client.post(tts_url, json=payload, headers=headers)
@@ -1,18 +1,32 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Tuple
 
 from dotenv import load_dotenv
 
 
-load_dotenv()
-
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = REPO_ROOT / "data"
 DEFAULT_DB_PATH = DATA_DIR / "finance.db"
+ENV_FILE = REPO_ROOT / ".env"
+
+if ENV_FILE.exists():
+    load_dotenv(ENV_FILE)
+
+
+def _parse_origins(raw: str) -> Tuple[str, ...]:
+    return tuple(origin.strip() for origin in raw.split(",") if origin.strip())
+
+
+def _parse_int(raw: str | None, default: int) -> int:
+    try:
+        return int(raw.strip()) if raw and raw.strip() else default
+    except ValueError:
+        return default
 
 
 @dataclass(frozen=True)
@@ -20,18 +34,14 @@ class Settings:
     api_title: str = "StockShock API"
     api_version: str = "0.1.0"
     db_path: str = os.getenv("FINANCE_DB_PATH", str(DEFAULT_DB_PATH))
+    duckdb_threads: int = _parse_int(os.getenv("DUCKDB_THREADS"), 0)
+    duckdb_memory_limit: str = os.getenv("DUCKDB_MEMORY_LIMIT", "")
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
     openai_model: str = os.getenv("OPENAI_MODEL", "gpt-5")
     gemini_api_key: str = os.getenv("GEMINI_API_KEY", "")
     gemini_model: str = os.getenv("GEMINI_MODEL", "gemini-3-flash-preview")
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    cors_origins: List[str] = field(
-        default_factory=lambda: [
-            origin.strip()
-            for origin in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",")
-            if origin.strip()
-        ]
-    )
+    cors_origins: Tuple[str, ...] = _parse_origins(os.getenv("CORS_ALLOW_ORIGINS", "*"))
     gradium_api_key: str = os.getenv("GRADIUM_API_KEY", "")
     gradium_region: str = os.getenv("GRADIUM_REGION", "eu")
     gradium_stt_model: str = os.getenv("GRADIUM_STT_MODEL", "default")
@@ -40,4 +50,9 @@ class Settings:
     gradium_tts_output_format: str = os.getenv("GRADIUM_TTS_OUTPUT_FORMAT", "wav")
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+settings = get_settings()
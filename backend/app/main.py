@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -8,18 +10,25 @@ from app.services.chaos_state import ensure_chaos_table
 
 configure_logging()
 
-app = FastAPI(title=settings.api_title, version=settings.api_version)
+CORS_ALLOW_ORIGINS = tuple(settings.cors_origins) or ("*",)
+CORS_ALLOW_METHODS = ("GET", "POST", "OPTIONS")
+CORS_ALLOW_HEADERS = ("Content-Type", "Authorization")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    ensure_chaos_table()
+    yield
+
+
+app = FastAPI(title=settings.api_title, version=settings.api_version, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=list(settings.cors_origins),
+    allow_origins=CORS_ALLOW_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_ALLOW_METHODS,
+    allow_headers=CORS_ALLOW_HEADERS,
 )
 
-@app.on_event("startup")
-def _init_chaos_state() -> None:
-    ensure_chaos_table()
-
 app.include_router(api_router)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import json
+import threading
 from typing import Any, Dict, Optional
 
+from cachetools import TTLCache
+
 from app.services.db import db_service
+from app.utils.json_tools import dumps, loads
 
 
 CREATE_TABLE_SQL = """
@@ -14,15 +17,36 @@ CREATE TABLE IF NOT EXISTS ui_preferences (
 )
 """.strip()
 
+UPSERT_CHAOS_SQL = """
+INSERT INTO ui_preferences (user_id, chaos_json, updated_at)
+VALUES (?, ?, CURRENT_TIMESTAMP)
+ON CONFLICT (user_id) DO UPDATE SET
+    chaos_json = excluded.chaos_json,
+    updated_at = excluded.updated_at
+""".strip()
+
+
+CHAOS_CACHE_MAXSIZE = 10_000
+CHAOS_CACHE_TTL_SECONDS = 60
+
+# Per-process cache of user_id -> chaos dict. Routes call into this module from
+# worker threads, so access goes through a lock.
+_chaos_cache: TTLCache = TTLCache(maxsize=CHAOS_CACHE_MAXSIZE, ttl=CHAOS_CACHE_TTL_SECONDS)
+_chaos_cache_lock = threading.Lock()
+
 
 def ensure_chaos_table() -> None:
+    """Create the preferences table; called once from the app lifespan."""
     db_service.execute(CREATE_TABLE_SQL)
 
 
 def get_chaos_state(user_id: str) -> Optional[Dict[str, Any]]:
     if not user_id:
         return None
-    ensure_chaos_table()
+    with _chaos_cache_lock:
+        cached = _chaos_cache.get(user_id)
+    if cached is not None:
+        return dict(cached)
     rows = db_service.query(
         "SELECT chaos_json FROM ui_preferences WHERE user_id = ?",
         [user_id],
@@ -33,9 +57,13 @@ def get_chaos_state(user_id: str) -> Optional[Dict[str, Any]]:
     if not chaos_json:
         return None
     try:
-        parsed = json.loads(chaos_json)
+        parsed = loads(chaos_json)
         if isinstance(parsed, dict):
-            return parsed
+            # Fill on a miss only: a set_chaos_state racing this read has
+            # already cached a newer value that must not be overwritten.
+            with _chaos_cache_lock:
+                cached = _chaos_cache.setdefault(user_id, parsed)
+            return dict(cached)
     except Exception:
         return None
     return None
@@ -44,10 +72,7 @@ def get_chaos_state(user_id: str) -> Optional[Dict[str, Any]]:
 def set_chaos_state(user_id: str, chaos: Dict[str, Any]) -> None:
     if not user_id or chaos is None:
         return
-    ensure_chaos_table()
-    chaos_json = json.dumps(chaos)
-    db_service.execute("DELETE FROM ui_preferences WHERE user_id = ?", [user_id])
-    db_service.execute(
-        "INSERT INTO ui_preferences (user_id, chaos_json, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
-        [user_id, chaos_json],
-    )
+    chaos_json = dumps(chaos)
+    db_service.execute(UPSERT_CHAOS_SQL, [user_id, chaos_json])
+    with _chaos_cache_lock:
+        _chaos_cache[user_id] = dict(chaos)
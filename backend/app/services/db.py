@@ -10,12 +10,26 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+def _connection_config() -> Dict[str, Any]:
+    """DuckDB settings applied to every connection (unset values keep DuckDB's defaults)."""
+    config: Dict[str, Any] = {}
+    if settings.duckdb_threads > 0:
+        config["threads"] = settings.duckdb_threads
+    if settings.duckdb_memory_limit:
+        config["memory_limit"] = settings.duckdb_memory_limit
+    return config
+
+
 class DuckDBService:
     def __init__(self, db_path: str = settings.db_path) -> None:
         self.db_path = db_path
+        self.config = _connection_config()
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        return duckdb.connect(self.db_path, config=self.config)
 
     def query(self, sql: str, params: Any = None) -> List[Dict[str, Any]]:
-        conn = duckdb.connect(self.db_path)
+        conn = self._connect()
         try:
             if params is not None:
                 result = conn.execute(sql, params)
@@ -32,7 +46,7 @@ class DuckDBService:
             conn.close()
 
     def execute(self, sql: str, params: Any = None) -> None:
-        conn = duckdb.connect(self.db_path)
+        conn = self._connect()
         try:
             if params is not None:
                 conn.execute(sql, params)
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 PLACEHOLDER_RE = re.compile(r"^QUERY_RESULT_(\d+)$")
 
@@ -107,3 +112,20 @@ def replace_query_placeholders(value: Any, query_results: List[Any]) -> Any:
         return {k: replace_query_placeholders(v, query_results) for k, v in value.items()}
 
     return value
+
+
+def dumps(value: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize ``value`` to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+    return json.dumps(value, default=default)
+
+
+def loads(text: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -1,14 +1,27 @@
 import argparse
 import datetime as dt
 import os
-import random
 
 import duckdb
+import numpy as np
+import pyarrow as pa
 
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DEFAULT_DB_PATH = os.path.join(BASE_DIR, "data", "finance.db")
 
+STOCK_PRICES_SCHEMA = pa.schema(
+    [
+        ("ticker", pa.string()),
+        ("date", pa.timestamp("us")),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.int64()),
+    ]
+)
+
 
 def setup_db(conn: duckdb.DuckDBPyConnection) -> None:
     conn.execute(
@@ -39,11 +52,10 @@ def setup_db(conn: duckdb.DuckDBPyConnection) -> None:
     )
 
 
-def daterange(start: dt.date, end: dt.date):
-    current = start
-    while current <= end:
-        yield current
-        current += dt.timedelta(days=1)
+def make_rng(seed: int) -> np.random.Generator:
+    # default_rng rejects negative seeds; --seed (plus the per-ticker offset)
+    # may be any int, as it was with random.Random.
+    return np.random.default_rng(seed % 2**32)
 
 
 def generate_series(
@@ -55,52 +67,112 @@ def generate_series(
     drift: float,
     volatility: float,
     volume_base: int,
-):
-    rng = random.Random(seed)
-    price = base_price
-    rows = []
-
-    for day in daterange(start, end):
-        daily_return = rng.gauss(drift, volatility)
-        open_price = price
-        close_price = max(0.01, open_price * (1 + daily_return))
-
-        swing = abs(rng.gauss(0, volatility / 2))
-        high_price = max(open_price, close_price) * (1 + swing)
-        low_price = min(open_price, close_price) * (1 - swing)
-
-        volume = int(max(0, rng.gauss(volume_base, volume_base * 0.2)))
-
-        rows.append(
-            (
-                ticker,
-                dt.datetime.combine(day, dt.time(0, 0)),
-                open_price,
-                high_price,
-                low_price,
-                close_price,
-                volume,
-            )
-        )
-        price = close_price
-
-    return rows
+) -> pa.Table:
+    days = np.arange(
+        np.datetime64(start, "D"),
+        np.datetime64(end, "D") + np.timedelta64(1, "D"),
+    )
+    num_days = len(days)
+
+    rng = make_rng(seed)
+    daily_returns = rng.normal(drift, volatility, num_days)
+    swings = np.abs(rng.normal(0, volatility / 2, num_days))
+    volumes = np.maximum(0, rng.normal(volume_base, volume_base * 0.2, num_days))
+
+    close_prices = np.maximum(0.01, base_price * np.cumprod(1 + daily_returns))
+    open_prices = np.concatenate(([base_price], close_prices[:-1]))
+    high_prices = np.maximum(open_prices, close_prices) * (1 + swings)
+    low_prices = np.minimum(open_prices, close_prices) * (1 - swings)
+
+    return pa.Table.from_arrays(
+        [
+            pa.array([ticker] * num_days, type=pa.string()),
+            pa.array(days.astype("datetime64[us]")),
+            pa.array(open_prices),
+            pa.array(high_prices),
+            pa.array(low_prices),
+            pa.array(close_prices),
+            pa.array(volumes.astype(np.int64)),
+        ],
+        schema=STOCK_PRICES_SCHEMA,
+    )
 
 
 def clear_stock_prices(conn: duckdb.DuckDBPyConnection, tickers: list[str]) -> None:
     if not tickers:
         return
-    placeholders = ", ".join(["?"] * len(tickers))
-    conn.execute(f"DELETE FROM stock_prices WHERE ticker IN ({placeholders})", tickers)
+    # A registered table keeps the statement text (and plan) identical for any
+    # number of tickers, unlike an IN (?, ?, ...) list.
+    conn.register("del_targets", pa.table({"ticker": pa.array(tickers, type=pa.string())}))
+    try:
+        conn.execute("DELETE FROM stock_prices WHERE ticker IN (SELECT ticker FROM del_targets)")
+    finally:
+        conn.unregister("del_targets")
 
 
-def insert_stock_prices(conn: duckdb.DuckDBPyConnection, rows: list[tuple]) -> None:
-    if not rows:
+def insert_stock_prices(conn: duckdb.DuckDBPyConnection, table: pa.Table) -> None:
+    if table.num_rows == 0:
         return
-    conn.executemany(
-        "INSERT INTO stock_prices VALUES (?, ?, ?, ?, ?, ?, ?)",
-        rows,
+    conn.register("rows_arrow", table)
+    try:
+        conn.execute("INSERT INTO stock_prices SELECT * FROM rows_arrow")
+    finally:
+        conn.unregister("rows_arrow")
+
+
+DUPLICATE_NEWS_SQL = """
+INSERT INTO news
+SELECT
+    news.ticker,
+    days.day + COALESCE(CAST(news.date AS TIME), TIME '12:00:00') AS date,
+    news.title,
+    news.author,
+    news.source,
+    news.url,
+    news.sentiment
+FROM news
+CROSS JOIN (
+    SELECT CAST(unnest(generate_series($start::DATE, $end::DATE, INTERVAL 1 DAY)) AS DATE) AS day
+) AS days
+"""
+
+# Copies the rows picked in the registered ``news_picks`` (day, rid) table, where
+# rid indexes news in a stable order.
+DUPLICATE_SAMPLED_NEWS_SQL = """
+INSERT INTO news
+SELECT
+    news.ticker,
+    news_picks.day + COALESCE(CAST(news.date AS TIME), TIME '12:00:00') AS date,
+    news.title,
+    news.author,
+    news.source,
+    news.url,
+    news.sentiment
+FROM news_picks
+JOIN (
+    SELECT *, row_number() OVER (ORDER BY ticker, date, title, url) - 1 AS rid
+    FROM news
+) AS news USING (rid)
+"""
+
+
+def sample_news_picks(
+    num_rows: int,
+    start: dt.date,
+    end: dt.date,
+    per_day: int,
+    seed: int,
+) -> pa.Table:
+    """Draw ``per_day`` distinct row indices for every day in ``[start, end]``."""
+    days = np.arange(
+        np.datetime64(start, "D"),
+        np.datetime64(end, "D") + np.timedelta64(1, "D"),
+    )
+    rng = make_rng(seed)
+    rids = np.concatenate(
+        [rng.choice(num_rows, size=per_day, replace=False) for _ in range(len(days))]
     )
+    return pa.table({"day": np.repeat(days, per_day), "rid": rids.astype(np.int64)})
 
 
 def duplicate_news(
@@ -110,42 +182,24 @@ def duplicate_news(
     per_day: int | None,
     seed: int,
 ) -> int:
-    existing = conn.execute(
-        "SELECT ticker, date, title, author, source, url, sentiment FROM news"
-    ).fetchall()
+    existing = conn.execute("SELECT count(*) FROM news").fetchone()[0]
     if not existing:
         print("No existing news rows found to duplicate.")
         return 0
 
-    rng = random.Random(seed)
-    total_inserted = 0
-
-    for idx, day in enumerate(daterange(start, end), start=1):
-        if per_day is not None and per_day < len(existing):
-            day_rows = rng.sample(existing, per_day)
-        else:
-            day_rows = existing
-
-        batch = []
-        for row in day_rows:
-            ticker, date_val, title, author, source, url, sentiment = row
-            if isinstance(date_val, dt.datetime):
-                time_part = date_val.time()
-            else:
-                time_part = dt.time(12, 0)
-            new_dt = dt.datetime.combine(day, time_part)
-            batch.append((ticker, new_dt, title, author, source, url, sentiment))
-
-        conn.executemany(
-            "INSERT INTO news VALUES (?, ?, ?, ?, ?, ?, ?)",
-            batch,
-        )
-        total_inserted += len(batch)
-
-        if idx % 30 == 0:
-            print(f"Duplicated news through {day.isoformat()} (total {total_inserted}).")
+    # Each path is a single INSERT ... SELECT covering every target day, so the
+    # source snapshot never includes rows inserted by this call.
+    if per_day is None or per_day >= existing:
+        result = conn.execute(DUPLICATE_NEWS_SQL, {"start": start, "end": end}).fetchone()
+        return result[0] if result else 0
 
-    return total_inserted
+    picks = sample_news_picks(existing, start, end, per_day, seed)
+    conn.register("news_picks", picks)
+    try:
+        result = conn.execute(DUPLICATE_SAMPLED_NEWS_SQL).fetchone()
+    finally:
+        conn.unregister("news_picks")
+    return result[0] if result else 0
 
 
 def main():
@@ -207,7 +261,7 @@ def main():
                 print(f"Skipping unknown ticker: {ticker}")
                 continue
             conf = params[ticker]
-            rows = generate_series(
+            table = generate_series(
                 ticker=ticker,
                 start=start,
                 end=end,
@@ -217,8 +271,8 @@ def main():
                 volatility=conf["vol"],
                 volume_base=conf["volume"],
             )
-            insert_stock_prices(conn, rows)
-            print(f"Inserted {len(rows)} rows for {ticker}.")
+            insert_stock_prices(conn, table)
+            print(f"Inserted {table.num_rows} rows for {ticker}.")
 
         total_news = duplicate_news(
             conn, start=start, end=end, per_day=args.news_per_day, seed=args.seed
@@ -46,3 +46,50 @@ def test_query_endpoint_hydrates_results_and_carries_chaos(monkeypatch):
     assert payload["intent"] == "performance"
     assert payload["dashboardSpec"]["blocks"][0]["props"]["data"][0]["AAPL"] == 100
     assert payload["dashboardSpec"]["chaos"]["rotation"] == 180
+
+
+def test_voice_tts_uses_injected_settings(monkeypatch):
+    import httpx
+
+    from app.core.config import Settings, get_settings
+
+    captured = {}
+
+    async def fake_post(self, url, json=None, headers=None, **kwargs):
+        captured.update(url=url, json=json, headers=headers)
+        return httpx.Response(200, content=b"RIFF", request=httpx.Request("POST", url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    app.dependency_overrides[get_settings] = lambda: Settings(
+        gradium_api_key="injected-key",
+        gradium_region="us",
+        gradium_tts_voice_id="injected-voice",
+    )
+    try:
+        client = TestClient(app)
+        response = client.post("/api/voice/tts", json={"text": "hello"})
+    finally:
+        app.dependency_overrides.pop(get_settings, None)
+
+    assert get_settings().gradium_api_key != "injected-key"
+    assert response.status_code == 200
+    assert response.content == b"RIFF"
+    assert captured["url"] == "https://us.api.gradium.ai/api/post/speech/tts"
+    assert captured["headers"] == {"x-api-key": "injected-key"}
+    assert captured["json"]["voice_id"] == "injected-voice"
+
+
+def test_cors_preflight_advertises_explicit_methods_and_headers():
+    client = TestClient(app)
+    response = client.options(
+        "/api/query",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-methods"] == "GET, POST, OPTIONS"
+    assert "Content-Type" in response.headers["access-control-allow-headers"]
@@ -0,0 +1,72 @@
+import pytest
+
+from app.services import chaos_state
+from app.services.db import db_service
+
+
+@pytest.fixture(autouse=True)
+def _clear_chaos_cache():
+    chaos_state._chaos_cache.clear()
+    yield
+    chaos_state._chaos_cache.clear()
+
+
+def test_chaos_state_round_trip(monkeypatch, tmp_path):
+    monkeypatch.setattr(db_service, "db_path", str(tmp_path / "chaos.db"))
+    chaos_state.ensure_chaos_table()
+
+    assert chaos_state.get_chaos_state("user-1") is None
+
+    chaos_state.set_chaos_state("user-1", {"rotation": 90, "theme": "matrix"})
+    assert chaos_state.get_chaos_state("user-1") == {"rotation": 90, "theme": "matrix"}
+
+    chaos_state.set_chaos_state("user-1", {"rotation": 180})
+    assert chaos_state.get_chaos_state("user-1") == {"rotation": 180}
+
+
+def test_chaos_state_ignores_non_dict_payload(monkeypatch, tmp_path):
+    monkeypatch.setattr(db_service, "db_path", str(tmp_path / "chaos.db"))
+    chaos_state.ensure_chaos_table()
+    db_service.execute(
+        "INSERT INTO ui_preferences (user_id, chaos_json) VALUES (?, ?)",
+        ["user-2", "[1, 2, 3]"],
+    )
+
+    assert chaos_state.get_chaos_state("user-2") is None
+
+
+def test_chaos_state_serves_cached_value_without_db(monkeypatch, tmp_path):
+    monkeypatch.setattr(db_service, "db_path", str(tmp_path / "chaos.db"))
+    chaos_state.ensure_chaos_table()
+    chaos_state.set_chaos_state("user-3", {"theme": "matrix"})
+
+    def fail_query(sql, params=None):
+        raise AssertionError("cache miss hit DuckDB")
+
+    monkeypatch.setattr(db_service, "query", fail_query)
+    cached = chaos_state.get_chaos_state("user-3")
+    assert cached == {"theme": "matrix"}
+
+    cached["theme"] = "mutated"
+    assert chaos_state.get_chaos_state("user-3") == {"theme": "matrix"}
+
+
+def test_chaos_state_read_does_not_overwrite_newer_cached_value(monkeypatch, tmp_path):
+    monkeypatch.setattr(db_service, "db_path", str(tmp_path / "chaos.db"))
+    chaos_state.ensure_chaos_table()
+    chaos_state.set_chaos_state("user-4", {"theme": "old"})
+    chaos_state._chaos_cache.clear()
+
+    original_query = db_service.query
+
+    def query_then_concurrent_set(sql, params=None):
+        rows = original_query(sql, params)
+        # Another request saves a new value after this read hit the DB.
+        chaos_state.set_chaos_state("user-4", {"theme": "new"})
+        return rows
+
+    monkeypatch.setattr(db_service, "query", query_then_concurrent_set)
+    assert chaos_state.get_chaos_state("user-4") == {"theme": "new"}
+
+    monkeypatch.setattr(db_service, "query", original_query)
+    assert chaos_state.get_chaos_state("user-4") == {"theme": "new"}
@@ -41,3 +41,10 @@ def test_failure():
         parse_json_from_text("no json here")
     with pytest.raises(json.JSONDecodeError):
         parse_json_from_text("{ incomplete ")
+
+def test_dumps_matches_stdlib_json():
+    from app.utils.json_tools import dumps, loads
+
+    payload = {"blocks": [{"type": "kpi-card", "props": {"value": 1.5}}], 1: "x"}
+    assert loads(dumps(payload)) == json.loads(json.dumps(payload))
+    assert loads(dumps({"when": object()}, default=lambda _: "obj")) == {"when": "obj"}
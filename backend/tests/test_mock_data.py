@@ -0,0 +1,114 @@
+import datetime as dt
+
+import duckdb
+import pytest
+
+from scripts.mock_data import duplicate_news, generate_series, setup_db
+
+
+@pytest.fixture
+def conn():
+    connection = duckdb.connect(":memory:")
+    setup_db(connection)
+    connection.execute(
+        """
+        INSERT INTO news VALUES
+            ('AAPL', TIMESTAMP '2023-05-01 09:30:00', 'a', NULL, 'src', 'u1', 0.3),
+            ('MSFT', TIMESTAMP '2023-05-02 14:45:10', 'b', 'me', 'src', 'u2', NULL),
+            ('TSLA', NULL, 'c', NULL, 'src', 'u3', -0.1),
+            ('BTC', TIMESTAMP '2023-05-03 23:59:59', 'd', NULL, 'src', 'u4', 1.0)
+        """
+    )
+    yield connection
+    connection.close()
+
+
+START = dt.date(2024, 1, 1)
+END = dt.date(2024, 1, 3)
+
+
+def _copies(conn):
+    return conn.execute(
+        "SELECT date, url FROM news WHERE date >= TIMESTAMP '2024-01-01' ORDER BY date, url"
+    ).fetchall()
+
+
+def test_duplicate_news_copies_every_row_per_day(conn):
+    inserted = duplicate_news(conn, START, END, per_day=None, seed=42)
+
+    assert inserted == 12
+    assert conn.execute("SELECT count(*) FROM news").fetchone()[0] == 16
+
+    copies = _copies(conn)
+    times = {url: set() for _, url in copies}
+    for date_val, url in copies:
+        assert START <= date_val.date() <= END
+        times[url].add(date_val.time())
+    assert times == {
+        "u1": {dt.time(9, 30)},
+        "u2": {dt.time(14, 45, 10)},
+        "u3": {dt.time(12, 0)},
+        "u4": {dt.time(23, 59, 59)},
+    }
+    for day in (START, dt.date(2024, 1, 2), END):
+        assert sorted(url for date_val, url in copies if date_val.date() == day) == [
+            "u1",
+            "u2",
+            "u3",
+            "u4",
+        ]
+
+
+def test_duplicate_news_samples_distinct_rows_per_day(conn):
+    originals = {
+        url: date_val
+        for date_val, url in conn.execute("SELECT date, url FROM news").fetchall()
+    }
+
+    inserted = duplicate_news(conn, START, END, per_day=2, seed=42)
+
+    assert inserted == 6
+    assert conn.execute("SELECT count(*) FROM news").fetchone()[0] == 10
+
+    by_day = {}
+    for date_val, url in _copies(conn):
+        by_day.setdefault(date_val.date(), []).append(url)
+        original = originals[url]
+        expected_time = original.time() if original is not None else dt.time(12, 0)
+        assert date_val.time() == expected_time
+    assert sorted(by_day) == [START, dt.date(2024, 1, 2), END]
+    for urls in by_day.values():
+        assert len(urls) == 2
+        assert len(set(urls)) == 2
+
+
+def test_duplicate_news_sampling_is_seeded(conn):
+    duplicate_news(conn, START, END, per_day=2, seed=7)
+    first = _copies(conn)
+    conn.execute("DELETE FROM news WHERE date >= TIMESTAMP '2024-01-01'")
+    duplicate_news(conn, START, END, per_day=2, seed=7)
+
+    assert _copies(conn) == first
+
+
+@pytest.mark.parametrize("seed", [-20000, -1, 0, 2**40])
+def test_generate_series_accepts_any_int_seed(seed):
+    table = generate_series(
+        ticker="AAPL",
+        start=START,
+        end=END,
+        seed=seed,
+        base_price=100.0,
+        drift=0.0,
+        volatility=0.01,
+        volume_base=1000,
+    )
+
+    assert table.num_rows == 3
+    assert table.column("ticker").to_pylist() == ["AAPL"] * 3
+
+
+def test_duplicate_news_sampling_accepts_negative_seed(conn):
+    inserted = duplicate_news(conn, START, END, per_day=2, seed=-1)
+
+    assert inserted == 6